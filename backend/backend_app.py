@@ -1,7 +1,20 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-import json
-import math
+import bisect
+import hashlib
+from collections import OrderedDict, namedtuple
+import os
+import stat
+import tempfile
+import threading
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, only single-process servers
+    fcntl = None
+from contextlib import contextmanager
 from datetime import datetime, date
 from flask_swagger_ui import get_swaggerui_blueprint
 from pathlib import Path
@@ -11,6 +24,18 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR.parent / "Frontend" / "static"
 JSON_FILE_PATH = BASE_DIR / "posts.json"
+# Lock file serializing writes across worker processes
+LOCK_FILE_PATH = BASE_DIR / "posts.json.lock"
+
+# Query parameter validation constants
+VALID_SORT_FIELDS = frozenset(("id", "title", "content", "author", "date"))
+VALID_SORT_FIELDS_MSG = "id, title, content, author, date"
+VALID_DIRECTIONS = frozenset(("asc", "desc"))
+
+# Rendered sorted/paginated pages kept per cache generation, limited both
+# by count and by their total size in bytes
+MAX_CACHED_PAGES = 256
+MAX_CACHED_PAGES_BYTES = 4 * 1024 * 1024
 
 # Swagger UI configuration constants
 SWAGGER_URL = "/api/docs"
@@ -39,7 +64,22 @@ DEFAULT_POSTS = [
 ]
 
 # --- FLASK APP INITIALIZATION ---
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, used by jsonify() and request.json
+    in place of Flask's stdlib json based default.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, static_folder=STATIC_DIR)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # --- SWAGGER UI SETUP ---
@@ -53,59 +93,522 @@ swagger_ui_blueprint = get_swaggerui_blueprint(
 )
 app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)
 
-def load_posts():
+# In-memory cache of the parsed posts, keyed by the file's signature
+# (see _file_signature). Each load or save builds a new cache generation
+# (see _update_cache) instead of modifying the current one, so a request
+# that holds a generation always sees consistent data.
+_POSTS_CACHE = {"signature": None}
+
+# Serializes mutations (via posts_write_lock) and cache reloads across
+# request threads. Reentrant because mutations call _cache_get() and
+# save_posts() while holding it.
+_write_lock = threading.RLock()
+# How deeply the current lock holder has entered posts_write_lock()
+_write_lock_depth = 0
+
+# Guards the rendered pages stored on each cache generation
+_pages_lock = threading.Lock()
+
+# Next ID to hand out; never lower than the highest ID seen on disk + 1
+_next_id = 1
+
+
+def parse_post_date(post):
+    """
+    Converts a post's date string to a date object for sorting.
+    """
+    date_str = post.get("date", "1900-01-01")
+    try:
+        # Keys are built once per cache generation, so the slower strptime
+        # is fine here; unlike date.fromisoformat it accepts dates without
+        # zero padding (e.g. 2024-5-3)
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        # If date format is invalid, treat as very old
+        return date(1900, 1, 1)
+
+
+def build_haystack(post):
     """
-    Loads blog posts from the JSON file. If the file is missing or empty,
-    it initializes it with DEFAULT_POSTS.
+    Joins the searchable fields of a post into one case-folded string.
+    The fields are separated by a control character so a search term
+    can't match across two fields.
     """
-    if not JSON_FILE_PATH.exists():
-        # If the file doesn't exist, create it with the initial data
-        save_posts(DEFAULT_POSTS)
-        return DEFAULT_POSTS
+    return (
+        f"{post.get('title', '')}\x1f{post.get('content', '')}\x1f"
+        f"{post.get('author', '')}\x1f{post.get('date', '')}"
+    ).casefold()
+
+
+def _ci_key(field):
+    """
+    Returns a sort key for case-insensitive sorting by a text field,
+    using locale-independent case folding.
+    """
+    def sort_key(post):
+        return str(post.get(field, "")).casefold()
+    return sort_key
 
+
+# Sort key for each valid sort field
+SORT_KEY_FUNCS = {
+    # Sort numerically by ID (THIS FIXES THE CRASH)
+    "id": lambda post: post.get("id", 0),
+    "title": _ci_key("title"),
+    "content": _ci_key("content"),
+    "author": _ci_key("author"),
+    "date": parse_post_date,
+}
+
+
+@contextmanager
+def posts_write_lock():
+    """
+    Holds the write lock for a load, mutate and save sequence. Besides the
+    in-process lock, it takes an exclusive flock on LOCK_FILE_PATH so
+    writes from several WSGI worker processes are serialized as well.
+    Reentrant within the thread holding it.
+    """
+    global _write_lock_depth
+    with _write_lock:
+        if _write_lock_depth or fcntl is None:
+            _write_lock_depth += 1
+            try:
+                yield
+            finally:
+                _write_lock_depth -= 1
+            return
+
+        LOCK_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(LOCK_FILE_PATH, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            _write_lock_depth = 1
+            try:
+                yield
+            finally:
+                _write_lock_depth = 0
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+def _file_signature(file_stat):
+    """
+    Returns what identifies a version of the posts file on disk. Every
+    save replaces the file, so the inode changes even when two saves fall
+    within the same (possibly coarse) mtime tick.
+    """
+    return (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+def _update_cache(signature, posts, content):
+    """
+    Builds a new cache generation for freshly loaded or saved posts and
+    swaps it in as a whole, then returns it. content is the raw JSON the
+    posts were read from or written as.
+
+    "etag" identifies the version of the posts for HTTP caching; it is a
+    hash of the file content, so it changes whenever the data does and is
+    the same in every worker process.
+    "serialized" holds the JSON bytes of the full list, built on first use.
+    "haystacks" holds each post's case-folded searchable text, parallel to
+    "data". "id_index" maps each post ID to its position in "data".
+    "sort_orders" holds the sorted list of positions in "data" for each
+    (sort field, descending) pair, built on first use. "corpus" joins all
+    haystacks into one string, with "corpus_offsets" holding the position
+    where each post's haystack starts; built on first search. "pages"
+    holds rendered sorted/paginated responses (see render_page), with
+    "pages_bytes" their total size.
+    """
+    global _POSTS_CACHE, _next_id
+    cache = {
+        "signature": signature,
+        "etag": hashlib.blake2b(content, digest_size=16).hexdigest(),
+        "data": posts,
+        "serialized": None,
+        "haystacks": [build_haystack(post) for post in posts],
+        "id_index": {post["id"]: i for i, post in enumerate(posts)},
+        "sort_orders": {},
+        "corpus": None,
+        "corpus_offsets": [],
+        "pages": OrderedDict(),
+        "pages_bytes": 0,
+    }
+    _POSTS_CACHE = cache
+    # Keep the ID counter ahead of posts written by other worker processes
+    _next_id = max(_next_id, max(cache["id_index"], default=0) + 1)
+    return cache
+
+
+def _cache_get():
+    """
+    Returns the current cache generation, loading blog posts from the
+    JSON file first if it changed on disk since the last load. If the
+    file is missing, it initializes it with DEFAULT_POSTS.
+    """
+    cache = _POSTS_CACHE
     try:
-        content = JSON_FILE_PATH.read_text()
-        if not content:
-            return []
-        return json.loads(content)
-    except json.JSONDecodeError:
-        return []
+        signature = _file_signature(os.stat(JSON_FILE_PATH))
+    except FileNotFoundError:
+        # If the file doesn't exist, create it with the initial data,
+        # unless another thread or worker created it while we waited
+        with posts_write_lock():
+            if not JSON_FILE_PATH.exists():
+                save_posts([dict(post) for post in DEFAULT_POSTS])
+                return _POSTS_CACHE
+        return _cache_get()
+
+    if cache["signature"] == signature:
+        return cache
+
+    with _write_lock:
+        # Read the whole file in a single call and hand the raw bytes
+        # straight to orjson, skipping text decoding. O_BINARY stops
+        # Windows from translating line endings, so the bytes (and the
+        # ETag hashed from them) match what save_posts() wrote.
+        fd = os.open(JSON_FILE_PATH, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            file_stat = os.fstat(fd)
+            # Another thread may have reloaded the file while we waited
+            signature = _file_signature(file_stat)
+            if _POSTS_CACHE["signature"] == signature:
+                return _POSTS_CACHE
+            content = os.read(fd, file_stat.st_size)
+        finally:
+            os.close(fd)
+
+        try:
+            posts = orjson.loads(content) if content else []
+        except orjson.JSONDecodeError:
+            posts = []
+
+        # Key the cache by the file actually read, in case it was replaced
+        return _update_cache(signature, posts, content)
+
+
+def get_posts():
+    """
+    Returns the current list of blog posts from the cache. The list is
+    shared between requests, so callers must not modify it in place.
+    """
+    return _cache_get()["data"]
 
 
 def save_posts(posts):
-    """Saves the current list of posts back to the JSON file."""
+    """
+    Saves the current list of posts back to the JSON file and refreshes
+    the in-memory cache so the write doesn't trigger a re-read.
+
+    The data is written to a temporary file first and then atomically
+    moved into place, so a partial write can't corrupt the posts file.
+    """
     JSON_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    JSON_FILE_PATH.write_text(json.dumps(posts, indent=4))
+    # A unique temporary file per save, so concurrent writers (e.g. other
+    # worker processes) never write into the same file
+    fd, tmp_path = tempfile.mkstemp(dir=JSON_FILE_PATH.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            content = orjson.dumps(posts, option=orjson.OPT_INDENT_2)
+            tmp_file.write(content)
+            tmp_file.flush()
+            # The renamed file keeps this inode, size and mtime
+            signature = _file_signature(os.fstat(tmp_file.fileno()))
+        # mkstemp creates the file as 0600; keep the posts file's mode.
+        # os.chmod (unlike os.fchmod) is available on every platform and
+        # leaves the mtime in the signature untouched.
+        try:
+            mode = stat.S_IMODE(os.stat(JSON_FILE_PATH).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, JSON_FILE_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _update_cache(signature, posts, content)
+
+
+def get_serialized_posts(cache):
+    """
+    Returns the full list of posts as JSON bytes, serializing it only
+    once per cache generation.
+    """
+    if cache["serialized"] is None:
+        cache["serialized"] = orjson.dumps(cache["data"])
+    return cache["serialized"]
+
+
+def get_sort_order(cache, sort_by, is_reverse):
+    """
+    Returns the positions of the cached posts sorted by the given field,
+    sorting only once per cache generation.
+    """
+    posts = cache["data"]
+    sort_orders = cache["sort_orders"]
+    order = sort_orders.get((sort_by, is_reverse))
+    if order is not None:
+        return order
+
+    # Keys (e.g. parsed dates) are computed once per post, not per compare
+    sort_key = SORT_KEY_FUNCS[sort_by]
+    keys = [sort_key(post) for post in posts]
+    order = sorted(
+        range(len(posts)), key=keys.__getitem__, reverse=is_reverse
+    )
+    sort_orders[(sort_by, is_reverse)] = order
+    return order
+
+
+def find_matching_indexes(cache, search_term):
+    """
+    Returns the positions of the cached posts whose haystack contains the
+    search term, in file order.
+
+    All haystacks are scanned as one contiguous string with str.find, so
+    the search skips straight from one match to the next instead of
+    testing every post separately.
+    """
+    haystacks = cache["haystacks"]
+    if not haystacks:
+        return []
+
+    if cache["corpus"] is None:
+        offsets = []
+        position = 0
+        for haystack in haystacks:
+            offsets.append(position)
+            position += len(haystack) + 1
+        cache["corpus_offsets"] = offsets
+        cache["corpus"] = "\x1e".join(haystacks)
+
+    corpus = cache["corpus"]
+    offsets = cache["corpus_offsets"]
+    indexes = []
+    found = corpus.find(search_term)
+    while found != -1:
+        i = bisect.bisect_right(offsets, found) - 1
+        # Ignore matches that run past the end of this post's haystack
+        if found + len(search_term) <= offsets[i] + len(haystacks[i]):
+            indexes.append(i)
+        if i + 1 == len(offsets):
+            break
+        found = corpus.find(search_term, offsets[i + 1])
+    return indexes
 
 
 def get_new_id():
-    """Returns the next available unique ID based on the current posts."""
-    posts = load_posts()
-    return max(post["id"] for post in posts) + 1 if posts else 1
+    """Returns the next available unique ID from the in-memory counter."""
+    global _next_id
+    new_id = _next_id
+    _next_id += 1
+    return new_id
 
 
 def add_post(data):
     """
     Internal function to create, timestamp, and save a new post object.
     """
-    new_post = {
-        "id": get_new_id(),
-        "title": data.get("title"),
-        "content": data.get("content"),
-        # Add new fields. Use today's date if date is missing.
-        "author": data.get("author", "Anonymous"),
-        "date": data.get("date", datetime.now().strftime("%Y-%m-%d")),
-    }
-
-    current_posts = load_posts()
-    current_posts.append(new_post)
-    save_posts(current_posts)
+    with posts_write_lock():
+        current_posts = get_posts()
+        new_post = {
+            "id": get_new_id(),
+            "title": data.get("title"),
+            "content": data.get("content"),
+            # Add new fields. Use today's date if date is missing.
+            "author": data.get("author", "Anonymous"),
+            "date": data.get("date", datetime.now().strftime("%Y-%m-%d")),
+        }
+
+        # Save a new list rather than appending to the shared cached one
+        save_posts(current_posts + [new_post])
 
     return new_post
 
 
-# Global list loaded on startup
-POSTS = load_posts()
+# Warm the cache (and seed the ID counter) once per process on startup.
+# Forked WSGI workers share these parsed posts until they change.
+_cache_get()
+
+def not_modified_response(cache):
+    """
+    Returns an empty 304 response if the client's If-None-Match header
+    matches the cached posts version, otherwise None.
+    """
+    etag = cache["etag"]
+    # If-None-Match uses weak comparison (RFC 9110), so ETags weakened by
+    # compressing proxies (W/"...") still match
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def with_etag(response, cache):
+    """Tags a response with the cached posts version and returns it."""
+    response.set_etag(cache["etag"])
+    return response
+
+
+# Parsed and validated query parameters for GET /api/posts
+QueryParams = namedtuple(
+    "QueryParams", "sort direction page per_page paginate err"
+)
+
+
+def parse_pagination(page, per_page):
+    """
+    Converts the raw 'page' and 'per_page' query values to integers.
+    A missing page defaults to 1; a missing per_page stays None so the
+    caller can pick its own default.
+    Returns a (page, per_page, error) tuple, where error is None if valid.
+    """
+    try:
+        # Convert to integers and ensure positive values
+        page = 1 if page is None else int(page)
+        per_page = None if per_page is None else int(per_page)
+    except ValueError:
+        return None, None, (
+            "Pagination parameters 'page' and 'per_page' "
+            "must be valid integers."
+        )
+
+    if page < 1 or (per_page is not None and per_page < 1):
+        return None, None, (
+            "Pagination parameters 'page' and 'per_page' "
+            "must be positive integers."
+        )
+
+    return page, per_page, None
+
+
+def _query_error(message):
+    """Returns QueryParams carrying only a validation error message."""
+    return QueryParams(None, None, None, None, False, message)
+
+
+def parse_query(args):
+    """
+    Parses and validates the sorting and pagination parameters of
+    GET /api/posts in one pass.
+    Returns QueryParams; 'err' holds the error message if invalid, and
+    'paginate' is set if any sorting or pagination parameter is present.
+    """
+    sort_by = args.get("sort")
+    direction = args.get("direction")
+    page = args.get("page")
+    per_page = args.get("per_page")
+
+    if sort_by or direction:
+        # Handle incomplete sorting parameters
+        if not (sort_by and direction):
+            return _query_error(
+                "Both 'sort' and 'direction' query"
+                " parameters must be provided for sorting."
+            )
+
+        # Handle invalid parameters
+        if sort_by not in VALID_SORT_FIELDS:
+            return _query_error(
+                f"Invalid sort field. Must be one of: "
+                f"{VALID_SORT_FIELDS_MSG}"
+            )
+        if direction not in VALID_DIRECTIONS:
+            return _query_error(
+                "Invalid sort direction. Must be 'asc' or 'desc'."
+            )
+
+    # Check if ANY sorting or pagination parameters are present
+    if not (sort_by or direction or page or per_page):
+        return QueryParams(None, None, None, None, False, None)
+
+    page, per_page, err = parse_pagination(page, per_page)
+    if err:
+        return _query_error(err)
+
+    return QueryParams(sort_by, direction, page, per_page, True, None)
+
+
+def render_page(cache, sort_by, direction, page, per_page):
+    """
+    Returns the sorted and paginated response for a cache generation as
+    JSON bytes. The most recently used pages are kept on the generation,
+    so they are dropped along with it on the next save. Pages larger than
+    the whole byte budget are rendered but not kept.
+    """
+    key = (sort_by, direction, page, per_page)
+    pages = cache["pages"]
+    with _pages_lock:
+        body = pages.get(key)
+        if body is not None:
+            pages.move_to_end(key)
+            return body
+
+    body = _render_page(cache, sort_by, direction, page, per_page)
+    if len(body) > MAX_CACHED_PAGES_BYTES:
+        return body
+
+    with _pages_lock:
+        # Another thread may have rendered the same page meanwhile
+        if key not in pages:
+            pages[key] = body
+            cache["pages_bytes"] += len(body)
+            while (
+                len(pages) > MAX_CACHED_PAGES
+                or cache["pages_bytes"] > MAX_CACHED_PAGES_BYTES
+            ):
+                _, evicted = pages.popitem(last=False)
+                cache["pages_bytes"] -= len(evicted)
+    return body
+
+
+def _render_page(cache, sort_by, direction, page, per_page):
+    """
+    Sorts and paginates the posts of a cache generation and returns the
+    structured response as JSON bytes.
+    """
+    posts = cache["data"]
+
+    # --- Sorting Logic ---
+    # Positions of the posts in sorted order (None keeps file order)
+    sort_order = None
+    if sort_by:
+        sort_order = get_sort_order(cache, sort_by, direction == "desc")
+
+    #--- Pagination Logic ---
+    # Default per_page to the total length if not provided
+    if per_page is None:
+        per_page = len(posts) if posts else 10
+
+    # Calculate indices and slice
+    total_posts = len(posts)
+    # Integer ceiling division to calculate total pages correctly
+    total_pages = (total_posts + per_page - 1) // per_page
+
+    start_index = (page - 1) * per_page
+    end_index = start_index + per_page
+
+    # Slice the list for the current page, materializing only the
+    # posts on that page when sorted
+    if sort_order is None:
+        paginated_posts = posts[start_index:end_index]
+    else:
+        paginated_posts = [
+            posts[i] for i in sort_order[start_index:end_index]
+        ]
+
+    # Return structured, paginated results
+    return orjson.dumps(
+        {
+            "total_posts": total_posts,
+            "total_pages": total_pages,
+            "current_page": page,
+            "per_page": per_page,
+            "results": paginated_posts,
+        }
+    )
+
 
 # --- API ENDPOINTS (Routes) ---
 
@@ -115,9 +618,8 @@ def handle_posts():
     Handles GET (Read, Sort, Paginate) and POST (Create) requests
     for blog posts.
     """
-    global POSTS
-    # Ensure posts are loaded (important for concurrent access simulation)
-    POSTS = load_posts()
+    # Ensure working with latest data (served from cache if unchanged)
+    cache = _cache_get()
 
     if request.method == "POST":
         data = request.json
@@ -134,191 +636,61 @@ def handle_posts():
         return jsonify(new_post), 201
 
     # --- GET Logic (Read, Sort, Paginate) ---
-    if request.method == "GET":
-        """
-        Returns all blog posts, with optional sorting and pagination
-        functionality via query parameters.
-        """
-        sort_by = request.args.get("sort")
-        direction = request.args.get("direction")
-
-        # Initialize the list of posts to be processed
-        posts_list = POSTS
-
-        # ID added here:
-        valid_sort_fields = ["id", "title", "content", "author", "date"]
-
-        # --- Sorting Logic ---
-        if sort_by or direction:
-            # 1.1 Handle incomplete sorting parameters
-            if (sort_by and not direction) or (direction and not sort_by):
-                return (
-                    jsonify(
-                        {
-                            "error": (
-                                "Both 'sort' and 'direction' query"
-								" parameters must be provided for sorting."
-                            )
-                        }
-                    ),
-                    400,
-                )
-
-            # Handle invalid parameters
-            if sort_by not in valid_sort_fields:
-                return (
-                    jsonify(
-                        {
-                            "error": (
-                                f"Invalid sort field. Must be one of: "
-                                f"{', '.join(valid_sort_fields)}"
-                            )
-                        }
-                    ),
-                    400,
-                )
-            if direction not in ["asc", "desc"]:
-                return (
-                    jsonify(
-                        {
-                            "error": (
-                                "Invalid sort direction. Must be 'asc' or "
-                                "'desc'."
-                            )
-                        }
-                    ),
-                    400,
-                )
-
-            # Apply sorting
-            is_reverse = direction == "desc"
-
-            if sort_by == "date":
-
-                def date_sort_key(post):
-                    """
-                    Converts post date string to date object for sorting.
-                    """
-                    date_str = post.get("date", "1900-01-01")
-                    try:
-                        return datetime.strptime(
-                            date_str, "%Y-%m-%d"
-                        ).date()
-                    except ValueError:
-                        # If date format is invalid, treat as very old
-                        return date(1900, 1, 1)
-
-                posts_list = sorted(
-                    POSTS, key=date_sort_key, reverse=is_reverse
-                )
-            elif sort_by == "id":
-                # Sort numerically by ID (THIS FIXES THE CRASH)
-                posts_list = sorted(
-                    POSTS, key=lambda post: post.get("id", 0),
-					reverse=is_reverse
-                )
-            else:
-                # Standard string sorting for title, content, author
-                posts_list = sorted(
-                    POSTS,
-                    key=lambda post: str(post.get(sort_by, "")).lower(),
-                    reverse=is_reverse,
-                )
-
-        #--- Pagination Logic ---
-        page = request.args.get("page")
-        per_page = request.args.get("per_page")
-
-        # Check if ANY sorting or pagination parameters are present
-        if sort_by or direction or page or per_page:
-            # Default page to 1 if sorting is present but page isn't
-            if page is None:
-                page = 1
-
-            # Default per_page to the total length if not provided
-            if per_page is None:
-                per_page = len(posts_list) if posts_list else 10
-
-            try:
-                # Convert to integers and ensure positive values
-                page = int(page)
-                per_page = int(per_page)
-            except ValueError:
-                return (
-                    jsonify(
-                        {
-                            "error": (
-                                "Pagination parameters 'page' and 'per_page' "
-                                "must be valid integers."
-                            )
-                        }
-                    ),
-                    400,
-                )
-
-            if page < 1 or per_page < 1:
-                return (
-                    jsonify(
-                        {
-                            "error": (
-                                "Pagination parameters 'page' and 'per_page' "
-                                "must be positive integers."
-                            )
-                        }
-                    ),
-                    400,
-                )
-
-            # Calculate indices and slice
-            total_posts = len(posts_list)
-            # Use math.ceil to calculate total pages correctly
-            total_pages = math.ceil(total_posts / per_page) \
-                if per_page > 0 else 0
-
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-
-            # Slice the list for the current page
-            paginated_posts = posts_list[start_index:end_index]
-
-            # Return structured, paginated results
-            return jsonify(
-                {
-                    "total_posts": total_posts,
-                    "total_pages": total_pages,
-                    "current_page": page,
-                    "per_page": per_page,
-                    "results": paginated_posts,
-                }
-            )
+    # Returns all blog posts, with optional sorting and pagination
+    # functionality via query parameters.
+    # Skip the work entirely if the client already has this version
+    not_modified = not_modified_response(cache)
+    if not_modified:
+        return not_modified
+
+    params = parse_query(request.args)
+    if params.err:
+        return jsonify({"error": params.err}), 400
+
+    #--- Default: Return plain list if NO query parameters ---
+    if not params.paginate:
+        return with_etag(
+            Response(get_serialized_posts(cache), mimetype="application/json"),
+            cache,
+        )
 
-        #--- Default: Return plain list if NO query parameters ---
-        return jsonify(POSTS)
+    # Identical pages are rendered once per posts version
+    return with_etag(
+        Response(
+            render_page(
+                cache,
+                params.sort,
+                params.direction,
+                params.page,
+                params.per_page,
+            ),
+            mimetype="application/json",
+        ),
+        cache,
+    )
 
 
 @app.route("/api/posts/<int:post_id>", methods=["DELETE"])
 def delete_post(post_id):
     """Deletes a post by its ID from the posts list and file."""
-    global POSTS
-    # Ensure working with latest data
-    POSTS = load_posts()
-
-    post_to_delete = None
-    for post in POSTS:
-        if post["id"] == post_id:
-            post_to_delete = post
-            break
+    with posts_write_lock():
+        # Ensure working with latest data (served from cache if unchanged)
+        cache = _cache_get()
+        posts = cache["data"]
 
-    # Error Handling: If post is not found
-    if post_to_delete is None:
-        return (
-            jsonify({"error": f"Post with id {post_id} not found."}),
-            404,
-        )
+        post_index = cache["id_index"].get(post_id)
 
-    # Delete the post from the list and SAVE to file
-    POSTS.remove(post_to_delete)
-    save_posts(POSTS)
+        # Error Handling: If post is not found
+        if post_index is None:
+            return (
+                jsonify({"error": f"Post with id {post_id} not found."}),
+                404,
+            )
+
+        # Delete the post from a copy of the list and SAVE to file
+        # (the cached list is shared with concurrent readers)
+        posts = posts[:post_index] + posts[post_index + 1:]
+        save_posts(posts)
 
     return (
         jsonify(
@@ -338,61 +710,63 @@ def update_post(post_id):
     Updates an existing post by its ID with optional title, content,
     author, or date changes.
     """
-    global POSTS
-    # Ensure working with latest data
-    POSTS = load_posts()
+    with posts_write_lock():
+        # Ensure working with latest data (served from cache if unchanged)
+        cache = _cache_get()
+        posts = cache["data"]
 
-    # Find the post's index to allow direct modification
-    post_index = -1
-    for i, post in enumerate(POSTS):
-        if post["id"] == post_id:
-            post_index = i
-            break
+        # Find the post's index
+        post_index = cache["id_index"].get(post_id)
 
-    # Error Handling: If post is not found
-    if post_index == -1:
-        return (
-            jsonify({"error": f"Post with id {post_id} not found."}),
-            404,
-        )
+        # Error Handling: If post is not found
+        if post_index is None:
+            return (
+                jsonify({"error": f"Post with id {post_id} not found."}),
+                404,
+            )
 
-    # Retrieve JSON data and update the post
-    data = request.get_json()
-    post_to_update = POSTS[post_index]
-
-    # Track if any changes were made
-    changes_made = False
-
-    if data:
-        # Update fields
-        if (
-            "title" in data
-            and post_to_update["title"] != data["title"]
-        ):
-            post_to_update["title"] = data["title"]
-            changes_made = True
-        if (
-            "content" in data
-            and post_to_update["content"] != data["content"]
-        ):
-            post_to_update["content"] = data["content"]
-            changes_made = True
-        if (
-            "author" in data
-            and post_to_update.get("author") != data["author"]
-        ):
-            post_to_update["author"] = data["author"]
-            changes_made = True
-        if (
-            "date" in data
-            and post_to_update.get("date") != data["date"]
-        ):
-            post_to_update["date"] = data["date"]
-            changes_made = True
-
-    # SAVE to file if changes were made
-    if changes_made:
-        save_posts(POSTS)
+        # Retrieve JSON data only once the post is known to exist
+        data = request.get_json()
+
+        # Update a copy of the post, as the cached one is shared with
+        # concurrent readers
+        post_to_update = dict(posts[post_index])
+
+        # Track if any changes were made
+        changes_made = False
+
+        if data:
+            # Update fields
+            if (
+                "title" in data
+                and post_to_update["title"] != data["title"]
+            ):
+                post_to_update["title"] = data["title"]
+                changes_made = True
+            if (
+                "content" in data
+                and post_to_update["content"] != data["content"]
+            ):
+                post_to_update["content"] = data["content"]
+                changes_made = True
+            if (
+                "author" in data
+                and post_to_update.get("author") != data["author"]
+            ):
+                post_to_update["author"] = data["author"]
+                changes_made = True
+            if (
+                "date" in data
+                and post_to_update.get("date") != data["date"]
+            ):
+                post_to_update["date"] = data["date"]
+                changes_made = True
+
+        # SAVE to file if changes were made
+        if changes_made:
+            posts = list(posts)
+            posts[post_index] = post_to_update
+            save_posts(posts)
 
     # Return the fully updated post object
     return jsonify(post_to_update), 200
@@ -402,42 +776,69 @@ def update_post(post_id):
 def search_posts():
     """
     Searches for blog posts based on a single query parameter ('query')
-    across title, content, author, and date fields.
+    across title, content, author, and date fields, with optional
+    pagination via 'page' and 'per_page'.
     Returns a structured JSON response with count, results, and a message.
     """
-    global POSTS
-    # Ensure working with latest data
-    POSTS = load_posts()
+    # Ensure working with latest data (served from cache if unchanged)
+    cache = _cache_get()
+    posts = cache["data"]
+
+    # Skip the work entirely if the client already has this version
+    not_modified = not_modified_response(cache)
+    if not_modified:
+        return not_modified
 
     # Get all query parameters from the URL
-    search_term = request.args.get("query", "").lower()
+    search_term = request.args.get("query", "").casefold()
+    page = request.args.get("page")
+    per_page = request.args.get("per_page")
 
     # If no search terms are provided, return all posts
-    if not search_term:
+    if not search_term and not (page or per_page):
         # Return all posts wrapped in the new structured format for consistency
-        return jsonify(
-            {
-                "count": len(POSTS),
-                "results": POSTS,
-                "message": f"{len(POSTS)} results found.",
-            }
+        return with_etag(
+            jsonify(
+                {
+                    "count": len(posts),
+                    "results": posts,
+                    "message": f"{len(posts)} results found.",
+                }
+            ),
+            cache,
         )
 
-    results = [
-        post
-        for post in POSTS
-        # Check if the search term is in title, content, author, OR date
-        if (
-            (search_term in post.get("title", "").lower())
-            or (search_term in post.get("content", "").lower())
-            or (search_term in post.get("author", "").lower())
-            or (search_term in post.get("date", "").lower())
-        )
-    ]
+    pagination = None
+    is_paginated = bool(page or per_page)
+    if is_paginated:
+        # Validate before scanning, so a bad request costs no search
+        page, per_page, err = parse_pagination(page, per_page)
+        if err:
+            return jsonify({"error": err}), 400
+
+    # Check if the search term is in title, content, author, OR date.
+    # A single scan yields the matching positions, which give both the
+    # total count and the posts on the requested page.
+    indexes = find_matching_indexes(cache, search_term)
+    count = len(indexes)
+
+    if is_paginated:
+        if per_page is None:
+            per_page = count or 10
+
+        start_index = (page - 1) * per_page
+        results = [
+            posts[i] for i in indexes[start_index:start_index + per_page]
+        ]
+        pagination = {
+            "total_pages": (count + per_page - 1) // per_page,
+            "current_page": page,
+            "per_page": per_page,
+        }
+    else:
+        results = [posts[i] for i in indexes]
 
     # Prepare structured response with the count and message
-    count = len(results)
-
     if count == 0:
         message = "0 results found."
     elif count == 1:
@@ -446,8 +847,13 @@ def search_posts():
         message = f"{count} results found."
 
     # Return the structured response
-    return jsonify({"count": count, "results": results, "message": message})
+    response = {"count": count, "results": results, "message": message}
+    if pagination:
+        response.update(pagination)
+    return with_etag(jsonify(response), cache)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5002, debug=True)
\ No newline at end of file
+    # Debug mode (and its reloader) is opt-in via FLASK_DEBUG=1. For
+    # production, serve the app through wsgi.py with a WSGI server.
+    app.run(host="0.0.0.0", port=5002, debug=os.getenv("FLASK_DEBUG") == "1")
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for running the Masterblog API with a production server,
+e.g. from the backend directory:
+
+    gunicorn -w 4 wsgi:application
+"""
+from backend_app import app
+
+application = app